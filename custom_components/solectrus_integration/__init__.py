@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
-from .api import SolectrusInfluxClient
+from .api import SolectrusInfluxClient, async_pop_validation_client
 from .const import (
     CONF_BUCKET,
     CONF_DATA_TYPE,
@@ -16,7 +17,9 @@ from .const import (
     CONF_TOKEN,
     CONF_URL,
     CONF_VERIFY_SSL,
+    DATA_TYPE_FLOAT,
     SENSOR_DEFINITIONS,
+    SensorDefinition,
 )
 from .data import SolectrusConfigEntry, SolectrusRuntimeData
 from .manager import ConfiguredSensor, SensorManager
@@ -33,7 +36,8 @@ async def async_setup_entry(
     entry: SolectrusConfigEntry,
 ) -> bool:
     """Set up the SOLECTRUS integration."""
-    client = SolectrusInfluxClient(
+    # Reuse the client that just validated the connection in the config flow.
+    client = async_pop_validation_client(hass, entry.data) or SolectrusInfluxClient(
         url=entry.data[CONF_URL],
         token=entry.data[CONF_TOKEN],
         org=entry.data[CONF_ORG],
@@ -82,21 +86,18 @@ def _build_sensor_map(entry: SolectrusConfigEntry) -> dict[str, ConfiguredSensor
         entity_id = settings.get(CONF_ENTITY_ID)
         if not entity_id:
             continue
+        # Interned like Home Assistant's own entity ids for fast lookups.
+        entity_id = sys.intern(entity_id)
 
-        defaults = SENSOR_DEFINITIONS.get(key)
-        measurement = settings.get(
-            CONF_MEASUREMENT, defaults.measurement if defaults else key.lower()
-        )
-        field = settings.get(CONF_FIELD, defaults.field if defaults else "value")
-        data_type = settings.get(
-            CONF_DATA_TYPE, defaults.data_type if defaults else "float"
+        defaults = SENSOR_DEFINITIONS.get(key) or SensorDefinition(
+            key.lower(), "value", DATA_TYPE_FLOAT
         )
         sensors[entity_id] = ConfiguredSensor(
             key=key,
             entity_id=entity_id,
-            measurement=measurement,
-            field=field,
-            data_type=data_type,
+            measurement=settings.get(CONF_MEASUREMENT, defaults.measurement),
+            field=settings.get(CONF_FIELD, defaults.field),
+            data_type=settings.get(CONF_DATA_TYPE, defaults.data_type),
         )
 
     return sensors
@@ -3,22 +3,49 @@
 from __future__ import annotations
 
 import asyncio
-import ssl
 from typing import TYPE_CHECKING, Any
 
-from influxdb_client import InfluxDBClient, Point, WritePrecision
-from influxdb_client.client.write_api import SYNCHRONOUS, WriteApi
+from aiohttp import ClientError
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.ssl import get_default_context, get_default_no_verify_context
+from influxdb_client import BucketsService, WritePrecision
+from influxdb_client.client.influxdb_client_async import InfluxDBClientAsync
 from influxdb_client.rest import ApiException
-from urllib3.exceptions import HTTPError
 
-from .const import LOGGER
+from .const import (
+    CONF_BUCKET,
+    CONF_ORG,
+    CONF_TOKEN,
+    CONF_URL,
+    CONF_VERIFY_SSL,
+    DOMAIN,
+    LOGGER,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
     from datetime import datetime
 
+    from homeassistant.core import Event, HomeAssistant
+    from influxdb_client.client.write_api_async import WriteApiAsync
+
 # HTTP status codes
 _HTTP_UNAUTHORIZED = 401
 _HTTP_FORBIDDEN = 403
+_HTTP_TOO_MANY_REQUESTS = 429
+_HTTP_SERVER_ERROR = 500
+
+# Hard limit for the config-flow validation request (seconds)
+_VALIDATION_TIMEOUT = 10
+
+# Upper bound of line-protocol records per write request
+MAX_BATCH_SIZE = 5000
+
+# How long a config-flow validation client is kept for reuse (seconds)
+VALIDATION_CLIENT_TTL = 60
+_VALIDATION_CLIENTS = "validation_clients"
 
 
 class SolectrusInfluxError(Exception):
@@ -34,7 +61,7 @@ class SolectrusAuthError(SolectrusInfluxError):
 
 
 class SolectrusInfluxClient:
-    """Thin wrapper around the sync InfluxDB client, executed off the event loop."""
+    """Thin wrapper around the async InfluxDB client."""
 
     def __init__(
         self, url: str, token: str, org: str, bucket: str, *, verify_ssl: bool = True
@@ -44,30 +71,33 @@ class SolectrusInfluxClient:
         self._token = token
         self._org = org
         self._bucket = bucket
-        self._client: InfluxDBClient | None = None
-        self._write_api: WriteApi | None = None
+        self._client: InfluxDBClientAsync | None = None
+        self._write_api: WriteApiAsync | None = None
         self._ssl = not url.lower().startswith("http://")
         self._verify_ssl = bool(verify_ssl) and self._ssl
 
     async def async_validate_connection(self) -> None:
         """Validate connectivity, auth, and bucket access."""
         client = await self._ensure_client()
-        loop = asyncio.get_running_loop()
         try:
-            bucket = await loop.run_in_executor(
-                None, lambda: client.buckets_api().find_bucket_by_name(self._bucket)
-            )
+            async with asyncio.timeout(_VALIDATION_TIMEOUT):
+                buckets = await BucketsService(client.api_client).get_buckets_async(
+                    name=self._bucket
+                )
         except ApiException as err:
             if err.status in (_HTTP_UNAUTHORIZED, _HTTP_FORBIDDEN):
                 msg = "Invalid token or insufficient permissions"
                 raise SolectrusAuthError(msg) from err
             msg = f"API error: {err}"
             raise SolectrusInfluxError(msg) from err
-        except (HTTPError, OSError) as err:
+        except TimeoutError as err:
+            msg = f"Connection timed out after {_VALIDATION_TIMEOUT}s"
+            raise SolectrusConnectionError(msg) from err
+        except (ClientError, OSError) as err:
             msg = f"Connection failed: {err}"
             raise SolectrusConnectionError(msg) from err
 
-        if bucket is None:
+        if not buckets.buckets:
             msg = "Bucket not found or token lacks permission"
             raise SolectrusInfluxError(msg)
 
@@ -75,74 +105,36 @@ class SolectrusInfluxClient:
         """Prepare the write API."""
         client = await self._ensure_client()
         if self._write_api is None:
-            loop = asyncio.get_running_loop()
-            self._write_api = await loop.run_in_executor(
-                None, lambda: client.write_api(write_options=SYNCHRONOUS)
-            )
-
-    async def async_write(
-        self,
-        measurement: str,
-        field: str,
-        value: Any,
-        timestamp: datetime | None = None,
-    ) -> None:
-        """Write a point to InfluxDB."""
-        if self._write_api is None:
-            await self.async_connect()
-
-        point = Point(measurement)
-        point.field(field, value)
-        if timestamp is not None:
-            point.time(timestamp, WritePrecision.S)
-
-        loop = asyncio.get_running_loop()
-        try:
-            await loop.run_in_executor(
-                None,
-                lambda: self._write_api.write(
-                    bucket=self._bucket,
-                    org=self._org,
-                    record=point,
-                    write_precision=WritePrecision.S,
-                ),
-            )
-        except ApiException as err:
-            if err.status == _HTTP_UNAUTHORIZED:
-                LOGGER.error("InfluxDB authentication failed")
-                raise SolectrusAuthError("Authentication failed") from err
-            LOGGER.error("InfluxDB API error: %s", err)
-            raise SolectrusInfluxError(f"API error: {err}") from err
-        except (HTTPError, OSError) as err:
-            LOGGER.warning("InfluxDB connection failed: %s", err)
-            raise SolectrusConnectionError(f"Connection failed: {err}") from err
+            self._write_api = client.write_api()
 
-    async def async_write_batch(self, points: list[Point]) -> None:
-        """Write multiple points to InfluxDB in a single request."""
-        if not points:
+    async def async_write_lines(self, payload: bytes) -> None:
+        """Write a pre-serialized line-protocol body (seconds precision)."""
+        if not payload:
             return
 
         if self._write_api is None:
             await self.async_connect()
 
-        loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(
-                None,
-                lambda: self._write_api.write(
-                    bucket=self._bucket,
-                    org=self._org,
-                    record=points,
-                    write_precision=WritePrecision.S,
-                ),
+            await self._write_api.write(
+                bucket=self._bucket,
+                org=self._org,
+                record=payload,
+                write_precision=WritePrecision.S,
             )
         except ApiException as err:
             if err.status == _HTTP_UNAUTHORIZED:
                 LOGGER.error("InfluxDB authentication failed")
                 raise SolectrusAuthError("Authentication failed") from err
+            if err.status == _HTTP_TOO_MANY_REQUESTS or (
+                err.status is not None and err.status >= _HTTP_SERVER_ERROR
+            ):
+                # Throttled or failing server: the same body may succeed later.
+                LOGGER.warning("InfluxDB unavailable: %s", err)
+                raise SolectrusConnectionError(f"Server unavailable: {err}") from err
             LOGGER.error("InfluxDB API error: %s", err)
             raise SolectrusInfluxError(f"API error: {err}") from err
-        except (HTTPError, OSError) as err:
+        except (ClientError, OSError) as err:
             LOGGER.warning("InfluxDB connection failed: %s", err)
             raise SolectrusConnectionError(f"Connection failed: {err}") from err
 
@@ -153,41 +145,116 @@ class SolectrusInfluxClient:
         self._write_api = None
         if client is None:
             return
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, client.close)
+        await client.close()
 
-    async def _ensure_client(self) -> InfluxDBClient:
-        """Create the client off the event loop to avoid blocking."""
+    async def _ensure_client(self) -> InfluxDBClientAsync:
+        """Create the async client, reusing Home Assistant's cached SSL contexts."""
         if self._client is not None:
             return self._client
 
-        loop = asyncio.get_running_loop()
-
-        def _build_client() -> InfluxDBClient:
-            ssl_param: bool | ssl.SSLContext
-            if not self._ssl:
-                ssl_param = False
-            elif self._verify_ssl:
-                ssl_param = ssl.create_default_context()
-            else:
-                insecure_context = ssl.create_default_context()
-                insecure_context.check_hostname = False
-                insecure_context.verify_mode = ssl.CERT_NONE
-                ssl_param = insecure_context
-            return InfluxDBClient(
+        # Always hand over a context: without one the client builds its own,
+        # which loads the CA bundle on the event loop (even for plain http).
+        ssl_context = (
+            get_default_context()
+            if self._verify_ssl
+            else get_default_no_verify_context()
+        )
+
+        try:
+            self._client = InfluxDBClientAsync(
                 url=self._url,
                 token=self._token,
                 org=self._org,
-                ssl=ssl_param,
+                enable_gzip=True,
                 verify_ssl=self._verify_ssl,
+                ssl_context=ssl_context,
             )
-
-        try:
-            self._client = await loop.run_in_executor(None, _build_client)
-        except (HTTPError, OSError) as err:
+        except OSError as err:
             msg = f"Connection failed: {err}"
             raise SolectrusConnectionError(msg) from err
         except (ValueError, TypeError) as err:
             msg = f"Invalid configuration: {err}"
             raise SolectrusInfluxError(msg) from err
         return self._client
+
+
+def _connection_key(data: Mapping[str, Any]) -> tuple[str, str, str, str, bool]:
+    """Identify a connection by all parameters that affect the client."""
+    return (
+        data[CONF_URL],
+        data[CONF_TOKEN],
+        data[CONF_ORG],
+        data[CONF_BUCKET],
+        bool(data.get(CONF_VERIFY_SSL, True)),
+    )
+
+
+@callback
+def async_get_validation_client(
+    hass: HomeAssistant, data: Mapping[str, Any]
+) -> SolectrusInfluxClient:
+    """
+    Return a cached client for config-flow validation.
+
+    Retries with the same parameters reuse the open connection. Clients are
+    closed VALIDATION_CLIENT_TTL seconds after their last use unless claimed,
+    or when Home Assistant stops.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache: dict[tuple, tuple[SolectrusInfluxClient, Callable[[], None]]] | None = (
+        domain_data.get(_VALIDATION_CLIENTS)
+    )
+    if cache is None:
+        cache = domain_data[_VALIDATION_CLIENTS] = {}
+
+        async def _async_close_all(_event: Event) -> None:
+            clients = list(cache.values())
+            cache.clear()
+            for client, cancel_expire in clients:
+                cancel_expire()
+                await client.async_close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_all)
+
+    key = _connection_key(data)
+    cached = cache.get(key)
+    if cached is not None:
+        client, cancel_expire = cached
+        # Restart the expiry so it cannot close the client mid-validation.
+        cancel_expire()
+    else:
+        client = SolectrusInfluxClient(
+            url=data[CONF_URL],
+            token=data[CONF_TOKEN],
+            org=data[CONF_ORG],
+            bucket=data[CONF_BUCKET],
+            verify_ssl=data.get(CONF_VERIFY_SSL, True),
+        )
+
+    async def _async_expire(_now: datetime) -> None:
+        cache.pop(key, None)
+        await client.async_close()
+
+    cache[key] = (
+        client,
+        async_call_later(hass, VALIDATION_CLIENT_TTL, _async_expire),
+    )
+    return client
+
+
+@callback
+def async_pop_validation_client(
+    hass: HomeAssistant, data: Mapping[str, Any]
+) -> SolectrusInfluxClient | None:
+    """Take over a cached validation client matching the connection data."""
+    cache = hass.data.get(DOMAIN, {}).get(_VALIDATION_CLIENTS)
+    if not cache:
+        return None
+
+    cached = cache.pop(_connection_key(data), None)
+    if cached is None:
+        return None
+
+    client, cancel_expire = cached
+    cancel_expire()
+    return client
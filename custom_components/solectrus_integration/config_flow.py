@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.helpers import selector
 
-from .api import SolectrusInfluxClient, SolectrusInfluxError
+from .api import SolectrusInfluxError, async_get_validation_client
 from .const import (
     CONF_BUCKET,
     CONF_DATA_TYPE,
@@ -22,9 +25,77 @@ from .const import (
     DATA_TYPE_OPTIONS,
     DOMAIN,
     LOGGER,
-    SENSOR_DEFINITIONS,
+    SENSOR_FORM_KEYS,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_EMPTY_SENSOR: Mapping[str, str] = MappingProxyType({})
+_CONNECTION_KEYS = (CONF_URL, CONF_TOKEN, CONF_ORG, CONF_BUCKET, CONF_VERIFY_SSL)
+
+# Selectors are immutable, so every form row shares the same instances.
+_URL_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.URL)
+)
+_PASSWORD_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.PASSWORD)
+)
+_TEXT_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
+)
+_BOOLEAN_SELECTOR = selector.BooleanSelector(selector.BooleanSelectorConfig())
+_OPTIONAL_ENTITY_SELECTOR = vol.Any(
+    None, selector.EntitySelector(selector.EntitySelectorConfig())
+)
+_DATA_TYPE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=DATA_TYPE_OPTIONS,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+
+
+def _sensor_rows(*, show_advanced: bool) -> tuple[tuple[str, str, str, Any, Any], ...]:
+    """Lay out the options form: (form key, sensor key, option, default, selector)."""
+    rows: list[tuple[str, str, str, Any, Any]] = []
+    for (
+        key,
+        definition,
+        entity_key,
+        measurement_key,
+        field_key,
+        data_type_key,
+    ) in SENSOR_FORM_KEYS:
+        rows.append(
+            (entity_key, key, CONF_ENTITY_ID, vol.UNDEFINED, _OPTIONAL_ENTITY_SELECTOR)
+        )
+        if show_advanced:
+            rows.extend(
+                (
+                    (
+                        measurement_key,
+                        key,
+                        CONF_MEASUREMENT,
+                        definition.measurement,
+                        _TEXT_SELECTOR,
+                    ),
+                    (field_key, key, CONF_FIELD, definition.field, _TEXT_SELECTOR),
+                    (
+                        data_type_key,
+                        key,
+                        CONF_DATA_TYPE,
+                        definition.data_type,
+                        _DATA_TYPE_SELECTOR,
+                    ),
+                )
+            )
+    return tuple(rows)
+
+
+_SENSOR_ROWS_BASIC = _sensor_rows(show_advanced=False)
+_SENSOR_ROWS_ADVANCED = _sensor_rows(show_advanced=True)
+
 
 class SolectrusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for SOLECTRUS."""
@@ -47,16 +118,16 @@ class SolectrusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         self._reconfigure_entry = entry
 
+        if user_input is not None and all(
+            user_input.get(key) == entry.data.get(key) for key in _CONNECTION_KEYS
+        ):
+            # Nothing that affects the connection changed; skip the round-trip.
+            return self.async_update_reload_and_abort(entry, data_updates=user_input)
+
         errors: dict[str, str] = {}
         placeholders: dict[str, str] = {}
         if user_input is not None:
-            client = SolectrusInfluxClient(
-                url=user_input[CONF_URL],
-                token=user_input[CONF_TOKEN],
-                org=user_input[CONF_ORG],
-                bucket=user_input[CONF_BUCKET],
-                verify_ssl=user_input.get(CONF_VERIFY_SSL, True),
-            )
+            client = async_get_validation_client(self.hass, user_input)
             try:
                 await client.async_validate_connection()
             except SolectrusInfluxError as exc:
@@ -72,8 +143,6 @@ class SolectrusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_update_reload_and_abort(
                     entry, data_updates=user_input
                 )
-            finally:
-                await client.async_close()
 
         defaults = user_input or entry.data
         return self.async_show_form(
@@ -91,13 +160,7 @@ class SolectrusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         placeholders: dict[str, str] = {}
         if user_input is not None:
-            client = SolectrusInfluxClient(
-                url=user_input[CONF_URL],
-                token=user_input[CONF_TOKEN],
-                org=user_input[CONF_ORG],
-                bucket=user_input[CONF_BUCKET],
-                verify_ssl=user_input.get(CONF_VERIFY_SSL, True),
-            )
+            client = async_get_validation_client(self.hass, user_input)
             try:
                 await client.async_validate_connection()
             except SolectrusInfluxError as exc:
@@ -118,8 +181,6 @@ class SolectrusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     title="InfluxDB-Exporter",
                     data=user_input,
                 )
-            finally:
-                await client.async_close()
 
         defaults = user_input or {}
         return self.async_show_form(
@@ -161,7 +222,7 @@ class SolectrusOptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Optional(
                         "advanced",
                         default=bool(self._config_entry.options.get("advanced", False)),
-                    ): selector.BooleanSelector(selector.BooleanSelectorConfig())
+                    ): _BOOLEAN_SELECTOR
                 }
             ),
         )
@@ -201,111 +262,66 @@ def _influx_schema(defaults: dict) -> vol.Schema:
             vol.Required(
                 CONF_URL,
                 default=defaults.get(CONF_URL, vol.UNDEFINED),
-            ): selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.URL,
-                ),
-            ),
+            ): _URL_SELECTOR,
             vol.Required(
                 CONF_TOKEN,
                 default=defaults.get(CONF_TOKEN, vol.UNDEFINED),
-            ): selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.PASSWORD,
-                ),
-            ),
+            ): _PASSWORD_SELECTOR,
             vol.Required(
                 CONF_ORG,
                 default=defaults.get(CONF_ORG, vol.UNDEFINED),
-            ): selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.TEXT,
-                ),
-            ),
+            ): _TEXT_SELECTOR,
             vol.Required(
                 CONF_BUCKET,
                 default=defaults.get(CONF_BUCKET, vol.UNDEFINED),
-            ): selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.TEXT,
-                ),
-            ),
+            ): _TEXT_SELECTOR,
             vol.Optional(
                 CONF_VERIFY_SSL,
                 default=defaults.get(CONF_VERIFY_SSL, True),
-            ): selector.BooleanSelector(selector.BooleanSelectorConfig()),
+            ): _BOOLEAN_SELECTOR,
         }
     )
 
 
 def _build_sensors_schema(existing_sensors: dict, *, show_advanced: bool) -> dict:
-    schema_dict: dict = {}
-
-    for key, definition in SENSOR_DEFINITIONS.items():
-        configured = existing_sensors.get(key, {})
-        schema_dict[
-            vol.Optional(
-                f"{key}_entity",
-                default=configured.get(CONF_ENTITY_ID, vol.UNDEFINED),
-            )
-        ] = vol.Any(
-            None,
-            selector.EntitySelector(selector.EntitySelectorConfig()),
-        )
-        if show_advanced:
-            schema_dict[
-                vol.Optional(
-                    f"{key}_measurement",
-                    default=configured.get(CONF_MEASUREMENT, definition.measurement),
-                )
-            ] = selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.TEXT,
-                )
-            )
-            schema_dict[
-                vol.Optional(
-                    f"{key}_field",
-                    default=configured.get(CONF_FIELD, definition.field),
-                )
-            ] = selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.TEXT,
-                )
-            )
-            schema_dict[
-                vol.Optional(
-                    f"{key}_data_type",
-                    default=configured.get(CONF_DATA_TYPE, definition.data_type),
-                )
-            ] = selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=DATA_TYPE_OPTIONS,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
-            )
-    return schema_dict
+    rows = _SENSOR_ROWS_ADVANCED if show_advanced else _SENSOR_ROWS_BASIC
+    return {
+        vol.Optional(
+            form_key,
+            default=(existing_sensors.get(key) or _EMPTY_SENSOR).get(option, default),
+        ): sensor_selector
+        for form_key, key, option, default, sensor_selector in rows
+    }
 
 
 def _parse_sensors_input(
     user_input: dict, existing_sensors: dict, *, show_advanced: bool
 ) -> dict[str, dict[str, str]]:
     sensors: dict[str, dict[str, str]] = {}
-    for key, definition in SENSOR_DEFINITIONS.items():
-        configured = existing_sensors.get(key, {})
-        entity_id = user_input.get(f"{key}_entity")
+    for (
+        key,
+        definition,
+        entity_key,
+        measurement_key,
+        field_key,
+        data_type_key,
+    ) in SENSOR_FORM_KEYS:
+        entity_id = user_input.get(entity_key)
+        if not entity_id:
+            continue
+
+        configured = existing_sensors.get(key) or _EMPTY_SENSOR
         measurement = configured.get(CONF_MEASUREMENT, definition.measurement)
         field = configured.get(CONF_FIELD, definition.field)
         data_type = configured.get(CONF_DATA_TYPE, definition.data_type)
         if show_advanced:
-            measurement = user_input.get(f"{key}_measurement") or measurement
-            field = user_input.get(f"{key}_field") or field
-            data_type = user_input.get(f"{key}_data_type") or data_type
-        if entity_id:
-            sensors[key] = {
-                CONF_ENTITY_ID: entity_id,
-                CONF_MEASUREMENT: measurement,
-                CONF_FIELD: field,
-                CONF_DATA_TYPE: data_type,
-            }
+            measurement = user_input.get(measurement_key) or measurement
+            field = user_input.get(field_key) or field
+            data_type = user_input.get(data_type_key) or data_type
+        sensors[key] = {
+            CONF_ENTITY_ID: entity_id,
+            CONF_MEASUREMENT: measurement,
+            CONF_FIELD: field,
+            CONF_DATA_TYPE: data_type,
+        }
     return sensors
@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from logging import Logger, getLogger
-from typing import Final
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 LOGGER: Logger = getLogger(__package__)
 
@@ -48,7 +52,7 @@ class SensorDefinition:
     data_type: str
 
 
-SENSOR_DEFINITIONS: dict[str, SensorDefinition] = {
+_SENSOR_DEFINITIONS: dict[str, SensorDefinition] = {
     "INVERTER_POWER": SensorDefinition("inverter", "power", DATA_TYPE_INT),
     "INVERTER_POWER_1": SensorDefinition("inverter_1", "power", DATA_TYPE_INT),
     "INVERTER_POWER_2": SensorDefinition("inverter_2", "power", DATA_TYPE_INT),
@@ -88,10 +92,28 @@ SENSOR_DEFINITIONS: dict[str, SensorDefinition] = {
     "OUTDOOR_TEMP": SensorDefinition("outdoor", "temperature", DATA_TYPE_FLOAT),
     "SYSTEM_STATUS": SensorDefinition("system", "status", DATA_TYPE_STRING),
     "SYSTEM_STATUS_OK": SensorDefinition("system", "status_ok", DATA_TYPE_BOOL),
+    **{
+        f"CUSTOM_{index:02d}": SensorDefinition(
+            f"custom_{index:02d}", "power", DATA_TYPE_INT
+        )
+        for index in range(1, 21)
+    },
 }
 
-for index in range(1, 21):
-    key = f"CUSTOM_{index:02d}"
-    SENSOR_DEFINITIONS[key] = SensorDefinition(
-        f"custom_{index:02d}", "power", DATA_TYPE_INT
+# Read-only view; the definitions are shared defaults and must not be mutated.
+SENSOR_DEFINITIONS: Final[Mapping[str, SensorDefinition]] = MappingProxyType(
+    _SENSOR_DEFINITIONS
+)
+
+# (key, definition, entity/measurement/field/data_type form keys) per sensor
+SENSOR_FORM_KEYS: Final = tuple(
+    (
+        key,
+        definition,
+        f"{key}_entity",
+        f"{key}_measurement",
+        f"{key}_field",
+        f"{key}_data_type",
     )
+    for key, definition in SENSOR_DEFINITIONS.items()
+)
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 type SolectrusConfigEntry = ConfigEntry[SolectrusRuntimeData]
 
 
-@dataclass
+@dataclass(slots=True)
 class SolectrusRuntimeData:
     """Runtime data stored on the config entry."""
 
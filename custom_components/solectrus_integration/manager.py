@@ -2,27 +2,49 @@
 
 from __future__ import annotations
 
+import asyncio
+import math
+import string
+from collections import deque
 from dataclasses import dataclass
+from dataclasses import field as dc_field
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import callback
 from homeassistant.helpers.event import (
     async_track_state_change_event,
     async_track_time_interval,
 )
 from homeassistant.util import dt as dt_util
-from influxdb_client import Point, WritePrecision
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import Event, HomeAssistant, State
 
-from .api import SolectrusInfluxClient, SolectrusInfluxError
+from .api import (
+    MAX_BATCH_SIZE,
+    SolectrusAuthError,
+    SolectrusConnectionError,
+    SolectrusInfluxClient,
+    SolectrusInfluxError,
+)
 from .const import FORECAST_SENSOR_KEYS, LOGGER
 
 BATCH_INTERVAL = timedelta(seconds=5)
 HEARTBEAT_INTERVAL = timedelta(minutes=5)
+FORECAST_INTERVAL = timedelta(minutes=5)
 GAP_FILL_ZERO_RESUME_THRESHOLD = timedelta(seconds=30)
+# Failed batch bodies kept for retry (at least 30 minutes of batches).
+MAX_RETRY_BODIES = 360
+# Upper bound for the retry backoff, in batch intervals.
+MAX_BACKOFF = 12
+# Flush early, before the next tick, once this many points are pending. This only
+# triggers a flush; api.MAX_BATCH_SIZE (5000) caps the lines sent per request.
+BURST_FLUSH_POINTS = 200
 
 BOOL_STRING_MAP: dict[str, bool] = {
     "on": True,
@@ -35,18 +57,118 @@ BOOL_STRING_MAP: dict[str, bool] = {
     "no": False,
 }
 
+_TRUE_STATES = frozenset(("on", "true"))
+_FALSE_STATES = frozenset(("off", "false"))
+_UNAVAILABLE_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE))
+# States starting with one of these never parse as a float, so skip the
+# attempt. "inf"/"nan" start with i/n and are still left to float().
+_NON_NUMERIC_FIRST = frozenset(string.ascii_letters) - frozenset("iInN")
+
 
 def _coerce_int(value: Any) -> int:
     return round(float(value))
 
 
+def _coerce_bool(value: Any) -> bool | None:
+    # Values come from _state_to_value, so exact type checks suffice.
+    value_type = type(value)
+    if value_type is bool:
+        return value
+    if value_type is int or value_type is float:
+        return bool(value)
+    if value_type is not str:
+        return None
+    # Most states are already lowercase; only lower() the rest.
+    result = BOOL_STRING_MAP.get(value)
+    return result if result is not None else BOOL_STRING_MAP.get(value.lower())
+
+
+def _passthrough(value: Any) -> Any:
+    return value
+
+
 SIMPLE_CONVERTERS: dict[str, Any] = {
     "int": _coerce_int,
     "float": float,
     "string": str,
+    "bool": _coerce_bool,
 }
 
 
+def _make_coercer(data_type: str) -> Callable[[Any], Any | None]:
+    """Resolve the converter for a data type once; failures coerce to None."""
+    converter = SIMPLE_CONVERTERS.get(data_type, _passthrough)
+
+    def coerce(value: Any) -> Any | None:
+        try:
+            return converter(value)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    return coerce
+
+
+# State attributes that may carry the source timestamp, in priority order.
+_TIMESTAMP_ATTRIBUTES = (
+    "timestamp",
+    "time",
+    "datetime",
+    "period_end",
+    "last_update",
+    "last_updated",
+)
+
+
+def _parse_iso(value: str) -> datetime | None:
+    """Parse an ISO 8601 timestamp, falling back to HA's lenient parser."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return dt_util.parse_datetime(value)
+
+
+def _parse_timestamp_attribute(raw: Any) -> datetime | None:
+    """Parse a timestamp attribute value; None if it is not usable."""
+    if isinstance(raw, datetime):
+        return dt_util.as_utc(raw)
+
+    if isinstance(raw, (int, float)):
+        # Heuristic: treat large values as milliseconds since epoch.
+        seconds = float(raw) / 1000 if raw > 10**12 else float(raw)
+        try:
+            return datetime.fromtimestamp(seconds, tz=UTC)
+        except (OverflowError, OSError, ValueError):
+            return None
+
+    if isinstance(raw, str):
+        parsed = _parse_iso(raw)
+        if parsed is not None:
+            return dt_util.as_utc(parsed)
+
+    return None
+
+
+# Line protocol escaping (same rules as influxdb_client's Point)
+_ESCAPE_MEASUREMENT = str.maketrans(
+    {",": r"\,", " ": r"\ ", "\n": r"\n", "\t": r"\t", "\r": r"\r"}
+)
+_ESCAPE_KEY = str.maketrans(
+    {",": r"\,", "=": r"\=", " ": r"\ ", "\n": r"\n", "\t": r"\t", "\r": r"\r"}
+)
+_ESCAPE_STRING = str.maketrans({'"': r"\"", "\\": r"\\"})
+
+
+def _format_field_value(value: Any) -> bytes | None:
+    """Format a field value for line protocol; None if it cannot be written."""
+    if isinstance(value, bool):
+        return b"true" if value else b"false"
+    if isinstance(value, int):
+        return b"%di" % value
+    if isinstance(value, float):
+        return repr(value).encode() if math.isfinite(value) else None
+    return f'"{str(value).translate(_ESCAPE_STRING)}"'.encode()
+
+
 @dataclass
 class ConfiguredSensor:
     """A single configured SOLECTRUS sensor mapping."""
@@ -58,15 +180,43 @@ class ConfiguredSensor:
     data_type: str
     last_value: Any | None = None
     last_timestamp: datetime | None = None
-
-
-@dataclass
+    is_forecast: bool = dc_field(init=False, repr=False, compare=False)
+    line_prefix: bytes = dc_field(init=False, repr=False, compare=False)
+    coerce: Callable[[Any], Any | None] = dc_field(
+        init=False, repr=False, compare=False
+    )
+    timestamp_key: str | None = dc_field(
+        default=None, init=False, repr=False, compare=False
+    )
+    forecast_updated: datetime | None = dc_field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Resolve the value converter, kind and line-protocol prefix once."""
+        self.coerce = _make_coercer(self.data_type)
+        self.is_forecast = self.key in FORECAST_SENSOR_KEYS
+        self.line_prefix = (
+            f"{self.measurement.translate(_ESCAPE_MEASUREMENT)} "
+            f"{self.field.translate(_ESCAPE_KEY)}="
+        ).encode()
+
+
+@dataclass(slots=True, frozen=True)
 class PendingPoint:
-    """A point waiting to be sent."""
+    """A point waiting to be sent, timestamped in epoch seconds."""
 
     sensor: ConfiguredSensor
     value: Any
-    timestamp: datetime
+    timestamp: int
+
+
+@dataclass(slots=True)
+class PendingSeries:
+    """A forecast series waiting to be sent, as (epoch seconds, value) pairs."""
+
+    sensor: ConfiguredSensor
+    points: list[tuple[int, Any]]
 
 
 class SensorManager:
@@ -85,43 +235,64 @@ class SensorManager:
         self._unsub_state = None
         self._unsub_batch = None
         self._unsub_heartbeat = None
-        self._pending: dict[str, PendingPoint] = {}
+        self._unsub_forecast = None
+        self._pending: dict[tuple[str, int], PendingPoint] = {}
+        self._pending_series: dict[str, PendingSeries] = {}
+        self._retry: deque[bytes] = deque(maxlen=MAX_RETRY_BODIES)
+        self._backoff = 1
+        self._skip_ticks = 0
+        self._flush_lock = asyncio.Lock()
+        self._forecast_tasks: set[asyncio.Task[None]] = set()
 
     async def async_start(self) -> None:
         """Start listening for state updates."""
+        now = dt_util.utcnow()
         # Queue initial values
         for sensor in self._sensors.values():
-            if sensor.key in FORECAST_SENSOR_KEYS:
+            if sensor.is_forecast:
                 continue
             current_state = self._hass.states.get(sensor.entity_id)
+            if current_state is None:
+                continue
             value = self._state_to_value(current_state)
             if value is not None:
                 timestamp = self._normalize_timestamp(
-                    self._state_to_timestamp(current_state) or dt_util.utcnow()
+                    self._state_to_timestamp(current_state, sensor)
                 )
-                coerced = self._coerce_value(value, sensor.data_type)
+                coerced = sensor.coerce(value)
                 if coerced is None:
                     continue
                 sensor.last_value = coerced
                 sensor.last_timestamp = timestamp
                 self._queue_point(sensor, coerced, timestamp=timestamp)
 
-        entity_ids = [sensor.entity_id for sensor in self._sensors.values()]
-        if entity_ids:
+        # Forecasts are polled on their own timer; only scalars are tracked.
+        scalar_sensors = {
+            entity_id: sensor
+            for entity_id, sensor in self._sensors.items()
+            if not sensor.is_forecast
+        }
+        if scalar_sensors:
             self._unsub_state = async_track_state_change_event(
                 self._hass,
-                entity_ids,
-                self._handle_state_change,
+                list(scalar_sensors),
+                partial(self._handle_state_change, scalar_sensors),
             )
         self._unsub_batch = async_track_time_interval(
-            self._hass, self._flush_batch, BATCH_INTERVAL
+            self._hass, self._tick, BATCH_INTERVAL
         )
         self._unsub_heartbeat = async_track_time_interval(
             self._hass, self._heartbeat, HEARTBEAT_INTERVAL
         )
+        if len(scalar_sensors) < len(self._sensors):
+            self._unsub_forecast = async_track_time_interval(
+                self._hass, self._refresh_forecasts, FORECAST_INTERVAL
+            )
+            self._refresh_forecasts(now)
 
         # Send initial batch immediately
-        await self._flush_batch(dt_util.utcnow())
+        if self._pending:
+            await self._flush_batch(now)
 
     async def async_stop(self) -> None:
         """Stop listeners and timers."""
@@ -134,30 +305,39 @@ class SensorManager:
         if self._unsub_heartbeat:
             self._unsub_heartbeat()
             self._unsub_heartbeat = None
+        if self._unsub_forecast:
+            self._unsub_forecast()
+            self._unsub_forecast = None
+        # Forecasts are polled again on the next start.
+        for task in self._forecast_tasks:
+            task.cancel()
+        await asyncio.gather(*self._forecast_tasks, return_exceptions=True)
         # Flush remaining points
-        if self._pending:
+        if self._pending or self._pending_series or self._retry:
             await self._flush_batch(dt_util.utcnow())
 
-    async def _handle_state_change(self, event: Event) -> None:
+    @callback
+    def _handle_state_change(
+        self,
+        sensors: dict[str, ConfiguredSensor],
+        event: Event,
+    ) -> None:
         """Handle a new state."""
-        entity_id = event.data["entity_id"]
-        sensor = self._sensors.get(entity_id)
-        if sensor is None:
-            return
-
-        new_state: State | None = event.data.get("new_state")
-        if sensor.key in FORECAST_SENSOR_KEYS:
-            await self._queue_forecast_points(sensor, new_state)
+        data = event.data
+        # The listener is registered for exactly these entity ids.
+        sensor = sensors[data["entity_id"]]
+        new_state: State | None = data["new_state"]
+        # Entity removed
+        if new_state is None:
             return
-
         value = self._state_to_value(new_state)
         if value is None:
             return
 
         timestamp = self._normalize_timestamp(
-            self._state_to_timestamp(new_state) or dt_util.utcnow()
+            self._state_to_timestamp(new_state, sensor)
         )
-        coerced = self._coerce_value(value, sensor.data_type)
+        coerced = sensor.coerce(value)
         if coerced is None:
             return
 
@@ -168,23 +348,27 @@ class SensorManager:
         # Avoid long-gap interpolation artifacts:
         # if we previously wrote 0 and nothing arrived for a while, then a positive
         # value comes in, insert an extra 0 point 1s before the new value.
-        should_gap_fill = False
-        if (
-            sensor.last_timestamp is not None
+        # Both timestamps are already normalized to UTC, so compare directly.
+        should_gap_fill = (
+            sensor.last_value == 0
+            and sensor.last_timestamp is not None
             and isinstance(sensor.last_value, (int, float))
-            and sensor.last_value == 0
             and isinstance(coerced, (int, float))
             and coerced > 0
-        ):
-            gap = dt_util.as_utc(timestamp) - dt_util.as_utc(sensor.last_timestamp)
-            should_gap_fill = gap >= GAP_FILL_ZERO_RESUME_THRESHOLD
+            and timestamp - sensor.last_timestamp >= GAP_FILL_ZERO_RESUME_THRESHOLD
+        )
 
         sensor.last_value = coerced
         sensor.last_timestamp = timestamp
         if should_gap_fill:
-            self._queue_point(sensor, 0, timestamp=timestamp - timedelta(seconds=1))
+            self._queue_point(
+                sensor,
+                sensor.coerce(0),
+                timestamp=timestamp - timedelta(seconds=1),
+            )
         self._queue_point(sensor, coerced, timestamp=timestamp)
 
+    @callback
     def _heartbeat(self, _now: datetime) -> None:
         """
         Periodically re-queue all current sensor values.
@@ -195,7 +379,7 @@ class SensorManager:
         timestamp = self._normalize_timestamp(dt_util.utcnow())
 
         for sensor in self._sensors.values():
-            if sensor.key in FORECAST_SENSOR_KEYS:
+            if sensor.is_forecast:
                 continue
 
             current_state = self._hass.states.get(sensor.entity_id)
@@ -203,7 +387,7 @@ class SensorManager:
             if value is None:
                 continue
 
-            coerced = self._coerce_value(value, sensor.data_type)
+            coerced = sensor.coerce(value)
             if coerced is None:
                 continue
 
@@ -211,27 +395,46 @@ class SensorManager:
             sensor.last_timestamp = timestamp
             self._queue_point(sensor, coerced, timestamp=timestamp)
 
+    @callback
+    def _refresh_forecasts(self, _now: datetime) -> None:
+        """Queue the forecast series of sensors whose state has been updated."""
+        for sensor in self._sensors.values():
+            if not sensor.is_forecast:
+                continue
+            state = self._hass.states.get(sensor.entity_id)
+            if state is None or state.last_updated == sensor.forecast_updated:
+                continue
+            sensor.forecast_updated = state.last_updated
+            # Only forecasts need to await a service call.
+            task = self._hass.async_create_task(
+                self._queue_forecast_points(sensor, state)
+            )
+            self._forecast_tasks.add(task)
+            task.add_done_callback(self._forecast_tasks.discard)
+
     def _queue_point(
         self,
         sensor: ConfiguredSensor,
         value: Any,
         *,
-        timestamp: datetime | None = None,
-        pending_key: str | None = None,
+        timestamp: datetime,
     ) -> None:
-        """Add a point to the pending batch, overwriting any previous value."""
-        coerced = self._coerce_value(value, sensor.data_type)
-        if coerced is None:
-            return
+        """
+        Add a point to the pending batch, overwriting any previous value.
 
-        normalized_timestamp = self._normalize_timestamp(timestamp or dt_util.utcnow())
-        self._pending[
-            pending_key or f"{sensor.key}:{normalized_timestamp.isoformat()}"
-        ] = PendingPoint(
+        Expects a value already coerced to the sensor's data type and a
+        normalized timestamp.
+        """
+        # One point per sensor and second; later values win.
+        epoch = int(timestamp.timestamp())
+        self._pending[(sensor.key, epoch)] = PendingPoint(
             sensor=sensor,
-            value=coerced,
-            timestamp=normalized_timestamp,
+            value=value,
+            timestamp=epoch,
         )
+        # Burst: flush now instead of waiting for the timer, unless backing off.
+        if len(self._pending) == BURST_FLUSH_POINTS and self._backoff == 1:
+            self._hass.async_create_task(self._flush_batch(dt_util.utcnow()))
 
     async def _queue_forecast_points(
         self,
@@ -253,14 +456,16 @@ class SensorManager:
                 value_key=value_key,
             )
 
-        for timestamp, value in sorted(series, key=lambda pair: pair[0]):
-            normalized_timestamp = self._normalize_timestamp(timestamp)
-            self._queue_point(
-                sensor,
-                value,
-                timestamp=normalized_timestamp,
-                pending_key=f"{sensor.key}:{normalized_timestamp.isoformat()}",
-            )
+        points: list[tuple[int, Any]] = []
+        for timestamp, value in series:
+            coerced = sensor.coerce(value)
+            if coerced is None:
+                continue
+            points.append((int(timestamp.timestamp()), coerced))
+
+        # A new forecast replaces any series of this sensor not yet sent.
+        if points:
+            self._pending_series[sensor.key] = PendingSeries(sensor, points)
 
     async def _weather_temperature_series(
         self,
@@ -295,7 +500,7 @@ class SensorManager:
             raw_time = item.get("datetime")
             if not raw_time:
                 continue
-            when = dt_util.parse_datetime(raw_time)
+            when = _parse_iso(raw_time)
             value = item.get("temperature")
             if when is not None and value is not None:
                 series.append((dt_util.as_utc(when), value))
@@ -316,138 +521,186 @@ class SensorManager:
             if not isinstance(item, dict):
                 continue
 
-            raw_time = None
-            for key in ("datetime", "time", "period_end"):
-                candidate = item.get(key)
-                if candidate:
-                    raw_time = candidate
-                    break
-            if raw_time is None:
+            raw_time = (
+                item.get("datetime") or item.get("time") or item.get("period_end")
+            )
+            if not raw_time:
                 continue
 
-            when = dt_util.parse_datetime(raw_time)
+            when = _parse_iso(raw_time)
             value = item.get(value_key)
             if when is not None and value is not None:
                 series.append((dt_util.as_utc(when), value))
 
         return series
 
+    @callback
+    def _tick(self, now: datetime) -> None:
+        """Schedule a flush only when there is something to send."""
+        if self._skip_ticks:
+            # Backing off after failed writes.
+            self._skip_ticks -= 1
+            return
+        if self._pending or self._pending_series or self._retry:
+            self._hass.async_create_task(self._flush_batch(now))
+
     async def _flush_batch(self, _now: datetime) -> None:
-        """Send all pending points as a batch."""
-        if not self._pending:
+        """Send pending points, preceded by any batches that failed earlier."""
+        # One write at a time, so retried bodies stay ahead of newer points.
+        async with self._flush_lock:
+            await self._async_write_pending()
+
+    async def _async_write_pending(self) -> None:
+        """Serialize and write everything queued; keep it for retry on failure."""
+        if not self._pending and not self._pending_series and not self._retry:
             return
 
         pending = self._pending
         self._pending = {}
+        pending_series = self._pending_series
+        self._pending_series = {}
+        retry = list(self._retry)
+        self._retry.clear()
+
+        # Group points of the same series so Influx ingests them contiguously.
+        lines: list[bytes] = []
+        append = lines.append
+        for item in sorted(
+            pending.values(),
+            key=lambda p: (p.sensor.measurement, p.sensor.field, p.timestamp),
+        ):
+            field_value = _format_field_value(item.value)
+            if field_value is not None:
+                prefix = item.sensor.line_prefix
+                append(b"%b%b %d\n" % (prefix, field_value, item.timestamp))
+        for series in pending_series.values():
+            prefix = series.sensor.line_prefix
+            for epoch, value in series.points:
+                field_value = _format_field_value(value)
+                if field_value is not None:
+                    append(b"%b%b %d\n" % (prefix, field_value, epoch))
+
+        # One request per body, oldest first so newer values for a second win.
+        bodies = retry + [
+            b"".join(lines[start : start + MAX_BATCH_SIZE])
+            for start in range(0, len(lines), MAX_BATCH_SIZE)
+        ]
+        failed: list[bytes] = []
+        error: SolectrusInfluxError | None = None
+        for index, body in enumerate(bodies):
+            try:
+                await self._client.async_write_lines(body)
+            except (SolectrusConnectionError, SolectrusAuthError) as err:
+                # Nothing else gets through either; keep this and the rest.
+                failed.extend(bodies[index:])
+                error = err
+                break
+            except SolectrusInfluxError as err:
+                # The server refused this body; sending it again cannot help.
+                LOGGER.warning(
+                    "Influx rejected a batch; dropping %d points: %s",
+                    body.count(b"\n"),
+                    err,
+                )
 
-        points: list[Point] = []
-        for item in pending.values():
-            point = Point(item.sensor.measurement)
-            point.field(item.sensor.field, item.value)
-            point.time(item.timestamp, WritePrecision.S)
-            points.append(point)
+        if error is None:
+            self._backoff = 1
+            return
 
-        try:
-            await self._client.async_write_batch(points)
-        except SolectrusInfluxError as err:
-            # Keep pending for next attempt; preserve newer values already queued.
-            for key, item in pending.items():
-                self._pending.setdefault(key, item)
-            LOGGER.debug(
-                "Influx batch write failed; keeping points for retry: %s",
-                err,
-                exc_info=True,
+        # The oldest bodies are dropped once the retry queue is full.
+        overflow = len(self._retry) + len(failed) - MAX_RETRY_BODIES
+        if overflow > 0:
+            dropped = [*self._retry, *failed][:overflow]
+            LOGGER.warning(
+                "Influx retry queue is full; dropping %d bodies (%d points)",
+                overflow,
+                sum(body.count(b"\n") for body in dropped),
             )
+        self._retry.extend(failed)
+        LOGGER.debug(
+            "Influx batch write failed; keeping %d bodies for retry: %s",
+            len(failed),
+            error,
+            exc_info=error,
+        )
+        # Wait 1, 2, 4, ... batch intervals before the next attempt.
+        self._skip_ticks = self._backoff - 1
+        self._backoff = min(self._backoff * 2, MAX_BACKOFF)
 
     @staticmethod
     def _coerce_value(value: Any, data_type: str) -> Any | None:
         """Coerce value to the configured datatype."""
-        try:
-            if data_type in SIMPLE_CONVERTERS:
-                coerced: Any | None = SIMPLE_CONVERTERS[data_type](value)
-            elif data_type == "bool":
-                if isinstance(value, bool):
-                    coerced = value
-                elif isinstance(value, (int, float)):
-                    coerced = bool(value)
-                else:
-                    coerced = (
-                        BOOL_STRING_MAP.get(value.lower())
-                        if isinstance(value, str)
-                        else None
-                    )
-            else:
-                coerced = value
-        except (TypeError, ValueError):
-            return None
-
-        return coerced
+        return _make_coercer(data_type)(value)
 
     @staticmethod
     def _normalize_timestamp(timestamp: datetime) -> datetime:
         """Normalize timestamps to match the write precision (seconds)."""
+        if timestamp.tzinfo is UTC:
+            if not timestamp.microsecond:
+                return timestamp
+            return timestamp.replace(microsecond=0)
         return dt_util.as_utc(timestamp).replace(microsecond=0)
 
     @staticmethod
-    def _state_to_timestamp(state: State | None) -> datetime | None:
-        """Extract a timestamp from a state (attributes preferred)."""
-        if state is None:
-            return None
+    def _state_to_timestamp(
+        state: State,
+        sensor: ConfiguredSensor | None = None,
+    ) -> datetime:
+        """
+        Extract a timestamp from a state (attributes preferred).
+
+        When a sensor is given, the attribute that last supplied its timestamp
+        is remembered and wins over the order of _TIMESTAMP_ATTRIBUTES; on a
+        miss the other attributes are scanned in that order.
+        """
+        attributes = state.attributes
+        cached = sensor.timestamp_key if sensor is not None else None
+        if cached is not None:
+            raw = attributes.get(cached)
+            if raw is not None and (parsed := _parse_timestamp_attribute(raw)):
+                return parsed
 
         # Prefer explicit source timestamps provided via state attributes.
-        for key in (
-            "timestamp",
-            "time",
-            "datetime",
-            "period_end",
-            "last_update",
-            "last_updated",
-        ):
-            raw = state.attributes.get(key)
+        for key in _TIMESTAMP_ATTRIBUTES:
+            if key == cached:
+                continue
+            raw = attributes.get(key)
             if raw is None:
                 continue
-
-            if isinstance(raw, datetime):
-                return dt_util.as_utc(raw)
-
-            if isinstance(raw, (int, float)):
-                # Heuristic: treat large values as milliseconds since epoch.
-                seconds = float(raw) / 1000 if raw > 10**12 else float(raw)
-                try:
-                    return datetime.fromtimestamp(seconds, tz=UTC)
-                except (OverflowError, OSError, ValueError):
-                    continue
-
-            if isinstance(raw, str):
-                parsed = dt_util.parse_datetime(raw)
-                if parsed is not None:
-                    return dt_util.as_utc(parsed)
+            parsed = _parse_timestamp_attribute(raw)
+            if parsed is not None:
+                if sensor is not None:
+                    sensor.timestamp_key = key
+                return parsed
 
         return dt_util.as_utc(state.last_updated)
 
     @staticmethod
     def _state_to_value(state: State | None) -> Any | None:
         """Convert a Home Assistant state to an Influx friendly value."""
-        if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+        if state is None or state.state in _UNAVAILABLE_STATES:
             return None
 
         raw = state.state
-        try:
-            int_value = int(raw)
-            if str(int_value) == raw:
-                return int_value
-        except ValueError:
-            pass
-
-        try:
-            return float(raw)
-        except ValueError:
-            pass
+        if raw[:1] not in _NON_NUMERIC_FIRST:
+            try:
+                number = float(raw)
+            except ValueError:
+                pass
+            else:
+                # Integral notation ("42", not "42.0" or "4e1") stays an int.
+                if (
+                    number.is_integer()
+                    and "." not in raw
+                    and "e" not in raw
+                    and "E" not in raw
+                ):
+                    return int(raw)
+                return number
 
         lowered = raw.lower()
-        if lowered in {"on", "true"}:
+        if lowered in _TRUE_STATES:
             return True
-        if lowered in {"off", "false"}:
+        if lowered in _FALSE_STATES:
             return False
-
         return raw
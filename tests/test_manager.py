@@ -1,13 +1,96 @@
 """Tests for the SensorManager utility functions."""
 
-from datetime import UTC, datetime
+import asyncio
+from datetime import UTC, datetime, timedelta, timezone
 
+from custom_components.solectrus_integration import manager as manager_module
+from custom_components.solectrus_integration.api import (
+    SolectrusConnectionError,
+    SolectrusInfluxError,
+)
 from custom_components.solectrus_integration.manager import (
+    MAX_RETRY_BODIES,
+    ConfiguredSensor,
     SensorManager,
     _coerce_int,
+    _format_field_value,
+    _parse_iso,
 )
 
 
+def make_sensor(
+    key="INVERTER_POWER",
+    entity_id="sensor.pv",
+    measurement="inverter",
+    field="power",
+    data_type="int",
+):
+    return ConfiguredSensor(
+        key=key,
+        entity_id=entity_id,
+        measurement=measurement,
+        field=field,
+        data_type=data_type,
+    )
+
+
+NOON = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)  # 1705320000
+
+
+class FakeHass:
+    """Just enough of Home Assistant for the manager's batching paths."""
+
+    def __init__(self):
+        self.states = {}
+        self.tasks = []
+
+    def async_create_task(self, coro):
+        task = asyncio.ensure_future(coro)
+        self.tasks.append(task)
+        return task
+
+
+class FakeClient:
+    """Records written bodies; fails with `error` or for `rejected` bodies."""
+
+    def __init__(self):
+        self.bodies = []
+        self.error = None
+        self.rejected = set()
+
+    async def async_write_lines(self, payload):
+        if self.error is not None:
+            raise self.error
+        if payload in self.rejected:
+            msg = "rejected"
+            raise SolectrusInfluxError(msg)
+        self.bodies.append(payload)
+
+
+def make_forecast_sensor():
+    return make_sensor(
+        key="INVERTER_POWER_FORECAST",
+        entity_id="sensor.forecast",
+        measurement="forecast",
+    )
+
+
+class FakeState:
+    """Minimal stand-in for a Home Assistant State."""
+
+    def __init__(self, state="0", attributes=None, last_updated=NOON):
+        self.state = state
+        self.attributes = attributes or {}
+        self.last_updated = last_updated
+
+
+def make_manager(*sensors):
+    sensors = sensors or (make_sensor(),)
+    return SensorManager(
+        FakeHass(), FakeClient(), {sensor.entity_id: sensor for sensor in sensors}
+    )
+
+
 class TestCoerceInt:
     """Tests for _coerce_int helper."""
 
@@ -90,6 +173,14 @@ class TestCoerceValue:
     def test_unknown_type_passthrough(self):
         assert SensorManager._coerce_value("value", "unknown") == "value"
 
+    def test_infinite_int(self):
+        assert SensorManager._coerce_value(float("inf"), "int") is None
+
+    def test_sensor_binds_coercer(self):
+        sensor = make_sensor()
+        assert sensor.coerce("41.6") == 42
+        assert sensor.coerce("bad") is None
+
 
 class TestStateToValue:
     """Tests for SensorManager._state_to_value using simple mock objects."""
@@ -119,6 +210,17 @@ class TestStateToValue:
         state = self.MockState("3.14")
         assert SensorManager._state_to_value(state) == 3.14
 
+    def test_negative_integer_string(self):
+        result = SensorManager._state_to_value(self.MockState("-42"))
+        assert result == -42
+        assert isinstance(result, int)
+
+    def test_integral_float_notation_stays_float(self):
+        for raw in ("42.0", "4.2e1"):
+            result = SensorManager._state_to_value(self.MockState(raw))
+            assert result == 42.0
+            assert isinstance(result, float)
+
     def test_on_state(self):
         state = self.MockState("on")
         assert SensorManager._state_to_value(state) is True
@@ -139,6 +241,10 @@ class TestStateToValue:
         state = self.MockState("heating")
         assert SensorManager._state_to_value(state) == "heating"
 
+    def test_special_float_state(self):
+        state = self.MockState("inf")
+        assert SensorManager._state_to_value(state) == float("inf")
+
 
 class TestAttributeForecastSeries:
     """Tests for SensorManager._attribute_forecast_series."""
@@ -209,6 +315,17 @@ class TestNormalizeTimestamp:
         result = SensorManager._normalize_timestamp(ts)
         assert result.tzinfo == UTC
 
+    def test_normalized_utc_returned_as_is(self):
+        ts = datetime(2024, 1, 15, 12, 30, 45, tzinfo=UTC)
+        assert SensorManager._normalize_timestamp(ts) is ts
+
+    def test_converts_offset_to_utc(self):
+        cet = timezone(timedelta(hours=1))
+        ts = datetime(2024, 1, 15, 13, 30, 45, 500, tzinfo=cet)
+        assert SensorManager._normalize_timestamp(ts) == datetime(
+            2024, 1, 15, 12, 30, 45, tzinfo=UTC
+        )
+
 
 class TestStateToTimestamp:
     """Tests for SensorManager._state_to_timestamp."""
@@ -242,3 +359,386 @@ class TestStateToTimestamp:
             last_updated=last_updated,
         )
         assert SensorManager._state_to_timestamp(state) == last_updated
+
+    def test_remembers_timestamp_attribute(self):
+        sensor = make_sensor()
+        state = self.MockState(attributes={"time": 1705321800})
+        SensorManager._state_to_timestamp(state, sensor)
+        assert sensor.timestamp_key == "time"
+
+        plain = self.MockState()
+        assert SensorManager._state_to_timestamp(plain, sensor) == plain.last_updated
+        assert sensor.timestamp_key == "time"
+
+    def test_attribute_after_state_without_attributes(self):
+        sensor = make_sensor()
+        plain = self.MockState()
+        assert SensorManager._state_to_timestamp(plain, sensor) == plain.last_updated
+
+        state = self.MockState(attributes={"timestamp": "2024-01-15T10:00:00+00:00"})
+        assert SensorManager._state_to_timestamp(state, sensor) == datetime(
+            2024, 1, 15, 10, 0, 0, tzinfo=UTC
+        )
+
+    def test_cached_attribute_miss_scans_all(self):
+        sensor = make_sensor()
+        SensorManager._state_to_timestamp(
+            self.MockState(attributes={"time": 1705321800}), sensor
+        )
+
+        state = self.MockState(attributes={"period_end": 1705325400})
+        assert SensorManager._state_to_timestamp(state, sensor) == datetime(
+            2024, 1, 15, 13, 30, 0, tzinfo=UTC
+        )
+        assert sensor.timestamp_key == "period_end"
+
+    def test_cached_attribute_is_not_probed_twice(self):
+        class RecordingAttributes(dict):
+            def __init__(self):
+                super().__init__()
+                self.probed = []
+
+            def get(self, key, default=None):
+                self.probed.append(key)
+                return super().get(key, default)
+
+        sensor = make_sensor()
+        sensor.timestamp_key = "time"
+        state = self.MockState()
+        state.attributes = attributes = RecordingAttributes()
+        SensorManager._state_to_timestamp(state, sensor)
+        assert sorted(attributes.probed) == sorted(manager_module._TIMESTAMP_ATTRIBUTES)
+
+    def test_cached_attribute_wins_over_priority_order(self):
+        sensor = make_sensor()
+        SensorManager._state_to_timestamp(
+            self.MockState(attributes={"last_update": 1705321800}), sensor
+        )
+
+        state = self.MockState(
+            attributes={"timestamp": 1705325400, "last_update": 1705321800}
+        )
+        assert SensorManager._state_to_timestamp(state, sensor) == datetime(
+            2024, 1, 15, 12, 30, 0, tzinfo=UTC
+        )
+
+
+class TestParseIso:
+    """Tests for _parse_iso."""
+
+    def test_zulu_suffix(self):
+        assert _parse_iso("2024-01-15T12:30:00Z") == datetime(
+            2024, 1, 15, 12, 30, 0, tzinfo=UTC
+        )
+
+    def test_invalid(self):
+        assert _parse_iso("not-a-date") is None
+
+
+class TestFormatFieldValue:
+    """Tests for _format_field_value line protocol formatting."""
+
+    def test_int_value(self):
+        assert _format_field_value(42) == b"42i"
+
+    def test_float_value(self):
+        assert _format_field_value(55.5) == b"55.5"
+
+    def test_bool_value(self):
+        assert _format_field_value(True) == b"true"
+        assert _format_field_value(False) == b"false"
+
+    def test_string_value_is_quoted_and_escaped(self):
+        assert _format_field_value('say "hi"\\') == b'"say \\"hi\\"\\\\"'
+
+    def test_non_finite_float_skipped(self):
+        assert _format_field_value(float("nan")) is None
+        assert _format_field_value(float("inf")) is None
+
+
+class TestLinePrefix:
+    """Tests for ConfiguredSensor.line_prefix."""
+
+    def test_plain_names(self):
+        sensor = make_sensor()
+        assert sensor.line_prefix == b"inverter power="
+
+    def test_escapes_measurement_and_field(self):
+        sensor = ConfiguredSensor(
+            key="CUSTOM_01",
+            entity_id="sensor.custom",
+            measurement="my house,1",
+            field="a=b c",
+            data_type="int",
+        )
+        assert sensor.line_prefix == b"my\\ house\\,1 a\\=b\\ c="
+
+
+class TestFlushBatch:
+    """Tests for serializing, splitting and retrying pending batches."""
+
+    async def test_writes_points_as_line_protocol(self):
+        manager = make_manager()
+        sensor = make_sensor()
+        manager._queue_point(sensor, 7, timestamp=NOON + timedelta(seconds=1))
+        manager._queue_point(sensor, 5, timestamp=NOON)
+        await manager._flush_batch(NOON)
+        assert manager._client.bodies == [
+            b"inverter power=5i 1705320000\ninverter power=7i 1705320001\n"
+        ]
+
+    async def test_splits_bodies_at_max_batch_size(self, monkeypatch):
+        monkeypatch.setattr(manager_module, "MAX_BATCH_SIZE", 2)
+        manager = make_manager()
+        sensor = make_sensor()
+        for second in range(3):
+            manager._queue_point(
+                sensor, second, timestamp=NOON + timedelta(seconds=second)
+            )
+        await manager._flush_batch(NOON)
+        assert [body.count(b"\n") for body in manager._client.bodies] == [2, 1]
+
+    async def test_failed_body_is_sent_before_newer_points(self):
+        manager = make_manager()
+        sensor = make_sensor()
+        client = manager._client
+        client.error = SolectrusConnectionError("down")
+        manager._queue_point(sensor, 1, timestamp=NOON)
+        await manager._flush_batch(NOON)
+        assert list(manager._retry) == [b"inverter power=1i 1705320000\n"]
+
+        client.error = None
+        manager._queue_point(sensor, 2, timestamp=NOON)
+        await manager._flush_batch(NOON)
+        assert client.bodies == [
+            b"inverter power=1i 1705320000\n",
+            b"inverter power=2i 1705320000\n",
+        ]
+        assert not manager._retry
+
+    async def test_rejected_body_does_not_block_others(self):
+        manager = make_manager()
+        rejected = b"inverter power=1i 1705320000\n"
+        manager._retry.append(rejected)
+        manager._client.rejected.add(rejected)
+        manager._queue_point(make_sensor(), 2, timestamp=NOON)
+        await manager._flush_batch(NOON)
+        assert manager._client.bodies == [b"inverter power=2i 1705320000\n"]
+        assert not manager._retry
+
+    async def test_retry_queue_drops_oldest_bodies(self, caplog):
+        manager = make_manager()
+        sensor = make_sensor()
+        manager._client.error = SolectrusConnectionError("down")
+        for second in range(MAX_RETRY_BODIES + 1):
+            manager._queue_point(sensor, 1, timestamp=NOON + timedelta(seconds=second))
+            await manager._flush_batch(NOON)
+        assert len(manager._retry) == MAX_RETRY_BODIES
+        assert manager._retry[0] == b"inverter power=1i 1705320001\n"
+        assert "dropping 1 bodies (1 points)" in caplog.text
+
+
+class TestPendingSeries:
+    """Tests for queueing and serializing forecast series."""
+
+    async def test_series_written_after_points(self, sample_forecast_list):
+        forecast = make_forecast_sensor()
+        manager = make_manager(make_sensor(), forecast)
+        state = FakeState(attributes={"forecast": sample_forecast_list})
+        await manager._queue_forecast_points(forecast, state)
+        manager._queue_point(make_sensor(), 5, timestamp=NOON)
+        await manager._flush_batch(NOON)
+        assert manager._client.bodies == [
+            (
+                b"inverter power=5i 1705320000\n"
+                b"forecast power=1500i 1705320000\n"
+                b"forecast power=1800i 1705323600\n"
+                b"forecast power=1200i 1705327200\n"
+            )
+        ]
+
+    async def test_newer_forecast_replaces_unsent_series(self, sample_forecast_list):
+        forecast = make_forecast_sensor()
+        manager = make_manager(forecast)
+        await manager._queue_forecast_points(
+            forecast, FakeState(attributes={"forecast": sample_forecast_list})
+        )
+        newer = [{"datetime": "2024-01-15T15:00:00+00:00", "power": 50}]
+        await manager._queue_forecast_points(
+            forecast, FakeState(attributes={"forecast": newer})
+        )
+        await manager._flush_batch(NOON)
+        assert manager._client.bodies == [b"forecast power=50i 1705330800\n"]
+
+
+class TestBackoff:
+    """Tests for skipping ticks after failed writes."""
+
+    async def test_failures_skip_ticks(self):
+        manager = make_manager()
+        manager._client.error = SolectrusConnectionError("down")
+        manager._queue_point(make_sensor(), 1, timestamp=NOON)
+        await manager._flush_batch(NOON)
+        await manager._flush_batch(NOON)
+        assert manager._backoff == 4
+        assert manager._skip_ticks == 1
+
+        manager._tick(NOON)
+        assert manager._hass.tasks == []
+        manager._tick(NOON)
+        assert len(manager._hass.tasks) == 1
+        await asyncio.gather(*manager._hass.tasks)
+        assert manager._skip_ticks == 3
+
+    async def test_rejected_body_is_dropped_and_backoff_resets(self):
+        manager = make_manager()
+        client = manager._client
+        rejected = b"inverter power=1i 1705320000\n"
+        manager._retry.append(rejected)
+        client.rejected.add(rejected)
+        manager._backoff = 4
+        manager._queue_point(make_sensor(), 2, timestamp=NOON)
+        await manager._flush_batch(NOON)
+        assert client.bodies == [b"inverter power=2i 1705320000\n"]
+        assert not manager._retry
+        assert manager._backoff == 1
+        assert manager._skip_ticks == 0
+
+    async def test_success_resets_backoff(self):
+        manager = make_manager()
+        client = manager._client
+        client.error = SolectrusConnectionError("down")
+        manager._queue_point(make_sensor(), 1, timestamp=NOON)
+        await manager._flush_batch(NOON)
+        assert manager._backoff == 2
+
+        client.error = None
+        await manager._flush_batch(NOON)
+        assert manager._backoff == 1
+        assert client.bodies == [b"inverter power=1i 1705320000\n"]
+
+        manager._queue_point(make_sensor(), 2, timestamp=NOON + timedelta(seconds=1))
+        manager._tick(NOON)
+        await asyncio.gather(*manager._hass.tasks)
+        assert client.bodies[-1] == b"inverter power=2i 1705320001\n"
+
+
+class TestBurstFlush:
+    """Tests for flushing early once many points are pending."""
+
+    async def test_threshold_schedules_one_flush(self, monkeypatch):
+        monkeypatch.setattr(manager_module, "BURST_FLUSH_POINTS", 2)
+        manager = make_manager()
+        sensor = make_sensor()
+        for second in range(3):
+            manager._queue_point(
+                sensor, second, timestamp=NOON + timedelta(seconds=second)
+            )
+        assert len(manager._hass.tasks) == 1
+        await asyncio.gather(*manager._hass.tasks)
+        assert manager._client.bodies == [
+            (
+                b"inverter power=0i 1705320000\n"
+                b"inverter power=1i 1705320001\n"
+                b"inverter power=2i 1705320002\n"
+            )
+        ]
+
+    async def test_heartbeat_reaching_threshold_schedules_flush(self, monkeypatch):
+        monkeypatch.setattr(manager_module, "BURST_FLUSH_POINTS", 2)
+        battery = make_sensor(
+            key="BATTERY_SOC", entity_id="sensor.soc", measurement="battery"
+        )
+        manager = make_manager(make_sensor(), battery)
+        manager._hass.states = {
+            "sensor.pv": FakeState("5"),
+            "sensor.soc": FakeState("80"),
+        }
+        # Must run on the event loop, where scheduling the flush is safe.
+        assert manager._heartbeat._hass_callback
+        manager._heartbeat(NOON)
+        assert len(manager._hass.tasks) == 1
+        await asyncio.gather(*manager._hass.tasks)
+        (body,) = manager._client.bodies
+        assert body.startswith(b"battery power=80i ")
+        assert b"\ninverter power=5i " in body
+
+    async def test_no_burst_flush_while_backing_off(self, monkeypatch):
+        monkeypatch.setattr(manager_module, "BURST_FLUSH_POINTS", 2)
+        manager = make_manager()
+        manager._backoff = 2
+        sensor = make_sensor()
+        manager._queue_point(sensor, 1, timestamp=NOON)
+        manager._queue_point(sensor, 2, timestamp=NOON + timedelta(seconds=1))
+        assert manager._hass.tasks == []
+
+    async def test_concurrent_flushes_are_serialized(self, monkeypatch):
+        monkeypatch.setattr(manager_module, "BURST_FLUSH_POINTS", 2)
+        manager = make_manager()
+        client = manager._client
+        release = asyncio.Event()
+        write = client.async_write_lines
+
+        async def slow_write(payload):
+            await release.wait()
+            await write(payload)
+
+        client.async_write_lines = slow_write
+        sensor = make_sensor()
+        manager._queue_point(sensor, 1, timestamp=NOON)
+        manager._queue_point(sensor, 2, timestamp=NOON + timedelta(seconds=1))
+        # Let the burst flush take the lock and block in the write.
+        await asyncio.sleep(0)
+        manager._queue_point(sensor, 3, timestamp=NOON + timedelta(seconds=2))
+        manager._tick(NOON)
+        await asyncio.sleep(0)
+        # The tick's flush waits for the lock instead of taking the new point.
+        assert len(manager._pending) == 1
+
+        release.set()
+        await asyncio.gather(*manager._hass.tasks)
+        assert client.bodies == [
+            b"inverter power=1i 1705320000\ninverter power=2i 1705320001\n",
+            b"inverter power=3i 1705320002\n",
+        ]
+
+
+class TestRefreshForecasts:
+    """Tests for polling forecast entities."""
+
+    async def test_skips_unchanged_last_updated(self, sample_forecast_list):
+        forecast = make_forecast_sensor()
+        manager = make_manager(forecast)
+        hass = manager._hass
+        hass.states[forecast.entity_id] = FakeState(
+            attributes={"forecast": sample_forecast_list}
+        )
+        manager._refresh_forecasts(NOON)
+        manager._refresh_forecasts(NOON)
+        assert len(hass.tasks) == 1
+        await asyncio.gather(*hass.tasks)
+        assert forecast.key in manager._pending_series
+
+        hass.states[forecast.entity_id] = FakeState(
+            attributes={"forecast": sample_forecast_list},
+            last_updated=NOON + timedelta(minutes=5),
+        )
+        manager._refresh_forecasts(NOON)
+        assert len(hass.tasks) == 2
+        await asyncio.gather(*hass.tasks)
+        assert manager._forecast_tasks == set()
+
+    async def test_stop_cancels_forecast_tasks(self, monkeypatch):
+        forecast = make_forecast_sensor()
+        manager = make_manager(forecast)
+        manager._hass.states[forecast.entity_id] = FakeState()
+
+        async def never_done(_sensor, _state):
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(manager, "_queue_forecast_points", never_done)
+        manager._refresh_forecasts(NOON)
+        (task,) = manager._hass.tasks
+        await manager.async_stop()
+        assert task.cancelled()
+        assert manager._forecast_tasks == set()